@@ -0,0 +1,81 @@
+/*
+ * Optional native Monty Hall simulator for run_simple_simulation.
+ *
+ * Build next to montyhall.py with:
+ *     cc -O3 -shared -fPIC -o _mh.so _mh.c
+ *
+ * Games are streamed from a xoshiro256** generator straight into counters,
+ * so no per-game arrays are ever materialized.
+ */
+
+#include <stdint.h>
+
+#if defined(_WIN32)
+#define MH_EXPORT __declspec(dllexport)
+#else
+#define MH_EXPORT
+#endif
+
+static uint64_t rotl(uint64_t x, int k)
+{
+    return (x << k) | (x >> (64 - k));
+}
+
+static uint64_t next(uint64_t s[4])
+{
+    uint64_t result = rotl(s[1] * 5, 7) * 9;
+    uint64_t t = s[1] << 17;
+
+    s[2] ^= s[0];
+    s[3] ^= s[1];
+    s[1] ^= s[2];
+    s[0] ^= s[3];
+    s[2] ^= t;
+    s[3] = rotl(s[3], 45);
+
+    return result;
+}
+
+static uint64_t splitmix64(uint64_t *x)
+{
+    uint64_t z = (*x += 0x9e3779b97f4a7c15ULL);
+    z = (z ^ (z >> 30)) * 0xbf58476d1ce4e5b9ULL;
+    z = (z ^ (z >> 27)) * 0x94d049bb133111ebULL;
+    return z ^ (z >> 31);
+}
+
+/* Map the top 32 bits of a draw onto [0, doors) without a division */
+static uint32_t pick_door(uint64_t s[4], uint32_t doors)
+{
+    return (uint32_t)(((next(s) >> 32) * doors) >> 32);
+}
+
+/*
+ * Simulate n games with the given number of doors.
+ *
+ * Staying wins iff the first pick is the car and switching wins otherwise,
+ * so Monty's reveal is never simulated. car_counts and choice_counts must
+ * each hold doors zero-initialized entries.
+ */
+MH_EXPORT void mh_simulate(uint64_t n, int doors, uint64_t seed,
+                           uint64_t *stay_wins, uint64_t *switch_wins,
+                           uint64_t *car_counts, uint64_t *choice_counts)
+{
+    uint64_t s[4];
+    uint64_t stay = 0;
+    uint64_t i;
+
+    for (i = 0; i < 4; i++)
+        s[i] = splitmix64(&seed);
+
+    for (i = 0; i < n; i++) {
+        uint32_t car = pick_door(s, (uint32_t)doors);
+        uint32_t choice = pick_door(s, (uint32_t)doors);
+        stay += car == choice;
+        car_counts[car]++;
+        choice_counts[choice]++;
+    }
+
+    *stay_wins = stay;
+    *switch_wins = n - stay;
+}
@@ -1,30 +1,54 @@
 import random
 import argparse
-import asyncio
+import ctypes
+import os
 from typing import Optional
 
-# Textual imports
-from textual.app import App, ComposeResult
-from textual.containers import Container, Horizontal, Vertical, Center
-from textual.widgets import (
-    Header,
-    Footer,
-    Button,
-    Static,
-    Input,
-    Label,
-    ProgressBar,
-    DataTable,
-    Tabs,
-    TabPane,
-    Pretty,
-    Collapsible,
-    Rule,
-)
-from textual.screen import Screen, ModalScreen
-from textual.binding import Binding
-from textual.reactive import reactive, var
-from textual import events
+import numpy as np
+
+# Shared generator for the batched simulation paths. Under `python montyhall.py`
+# this module also runs as __main__, and montyhall_tui gets a second copy via
+# `import montyhall`, so the TUI always draws from that copy's generator
+RNG = np.random.default_rng()
+
+# Most games simulated per NumPy batch, which bounds memory for any run size
+CLI_CHUNK_SIZE = 4_000_000
+
+
+def run_batch(
+    rng: np.random.Generator,
+    batch: int,
+    num_doors: int,
+    scratch: Optional[np.ndarray] = None,
+) -> tuple[np.int64, np.int64, np.ndarray, np.ndarray]:
+    """Simulate a batch of games, returning wins and per-door counts"""
+    # Monty always leaves the car closed, so for any number of doors staying
+    # wins iff the first pick is the car and switching wins otherwise. Which
+    # goats he reveals never matters, so no door opening is simulated at all
+    # np.bincount counts intp directly, any other dtype is copied first
+    car, choice = rng.integers(0, num_doors, (2, batch), dtype=np.intp)
+
+    if num_doors * num_doors > batch:
+        # Too many doors for the joint histogram to pay off
+        stay_wins = np.int64(np.count_nonzero(car == choice))
+        return (
+            stay_wins,
+            batch - stay_wins,
+            np.bincount(car, minlength=num_doors),
+            np.bincount(choice, minlength=num_doors),
+        )
+
+    # One pass over the joint (car, choice) histogram gives both door counts,
+    # and its diagonal holds the games where staying wins
+    if scratch is None:
+        # Callers running many batches pass a reusable intp buffer instead
+        scratch = np.empty(batch, dtype=np.intp)
+    index = np.multiply(car, num_doors, out=scratch[:batch])
+    index += choice
+    joint = np.bincount(index, minlength=num_doors * num_doors)
+    joint = joint.reshape(num_doors, num_doors)
+    stay_wins = np.trace(joint)
+    return stay_wins, batch - stay_wins, joint.sum(axis=1), joint.sum(axis=0)
 
 
 class SimulationResults:
@@ -33,26 +57,21 @@ class SimulationResults:
     def __init__(self, num_games: int, num_doors: int):
         self.num_games = num_games
         self.num_doors = num_doors
-        self.switch_wins = 0
-        self.stay_wins = 0
-        self.car_door_counts = {i: 0 for i in range(num_doors)}
-        self.player_choice_counts = {i: 0 for i in range(num_doors)}
+        # Kept as NumPy scalars so batch totals accumulate without casts
+        self.switch_wins = np.int64(0)
+        self.stay_wins = np.int64(0)
+        self.car_door_counts = np.zeros(num_doors, dtype=np.int64)
+        self.player_choice_counts = np.zeros(num_doors, dtype=np.int64)
+        self.theoretical_switch_rate = (num_doors - 1) / num_doors
+        self.theoretical_stay_rate = 1 / num_doors
 
     @property
     def switch_rate(self) -> float:
-        return self.switch_wins / self.num_games if self.num_games > 0 else 0
+        return float(self.switch_wins) / self.num_games if self.num_games > 0 else 0
 
     @property
     def stay_rate(self) -> float:
-        return self.stay_wins / self.num_games if self.num_games > 0 else 0
-
-    @property
-    def theoretical_switch_rate(self) -> float:
-        return (self.num_doors - 1) / self.num_doors
-
-    @property
-    def theoretical_stay_rate(self) -> float:
-        return 1 / self.num_doors
+        return float(self.stay_wins) / self.num_games if self.num_games > 0 else 0
 
 
 class GameState:
@@ -62,7 +81,7 @@ class GameState:
         self.num_doors = num_doors
         self.car_door = random.randint(0, num_doors - 1)
         self.player_choice: Optional[int] = None
-        self.doors_opened = set()
+        self.doors_opened = 0  # Bitmask, bit i set when door i is open
         self.final_choice: Optional[int] = None
         self.game_over = False
 
@@ -77,24 +96,26 @@ class GameState:
         if self.player_choice is None:
             return
 
-        doors_to_keep_closed = {self.car_door}
+        doors_to_keep_closed = 1 << self.car_door
         if self.player_choice != self.car_door:
-            doors_to_keep_closed.add(self.player_choice)
+            doors_to_keep_closed |= 1 << self.player_choice
         else:
             # If player chose car door, keep one random other door closed
-            other_doors = [i for i in range(self.num_doors) if i != self.car_door]
-            doors_to_keep_closed.add(random.choice(other_doors))
+            other_door = random.randint(0, self.num_doors - 2)
+            doors_to_keep_closed |= 1 << (other_door + (other_door >= self.car_door))
 
-        for door in range(self.num_doors):
-            if door not in doors_to_keep_closed:
-                self.doors_opened.add(door)
+        all_doors = (1 << self.num_doors) - 1
+        self.doors_opened |= all_doors & ~doors_to_keep_closed
+
+    def is_door_open(self, door: int) -> bool:
+        return bool((self.doors_opened >> door) & 1)
 
     def get_available_doors(self) -> list[int]:
         """Get doors that are still available to choose"""
-        return [i for i in range(self.num_doors) if i not in self.doors_opened]
+        return [i for i in range(self.num_doors) if not (self.doors_opened >> i) & 1]
 
     def make_final_choice(self, door: int) -> bool:
-        if door in self.get_available_doors():
+        if 0 <= door < self.num_doors and not self.is_door_open(door):
             self.final_choice = door
             self.game_over = True
             return True
@@ -108,966 +129,152 @@ class GameState:
         )
 
 
-class SimulationScreen(Screen):
-    """Screen for running statistical simulations"""
-
-    BINDINGS = [Binding("escape", "back", "Back to Menu")]
-
-    def __init__(self, num_games: int = 10000, num_doors: int = 3):
-        super().__init__()
-        self.num_games = num_games
-        self.num_doors = num_doors
-        self.results: Optional[SimulationResults] = None
-
-    def compose(self) -> ComposeResult:
-        yield Header(show_clock=True)
-        yield Container(
-            Static(
-                f"[bold blue]Statistical Simulation[/] - {self.num_games:,} games with {self.num_doors} doors",
-                classes="title",
-            ),
-            Rule(),
-            Static("Running simulation...", id="status"),
-            ProgressBar(id="progress"),
-            Container(id="results-container"),
-            classes="simulation-screen",
-        )
-        yield Footer()
-
-    async def on_mount(self) -> None:
-        await self.run_simulation()
-
-    async def run_simulation(self):
-        """Run the simulation with progress updates"""
-        self.results = SimulationResults(self.num_games, self.num_doors)
-        progress = self.query_one("#progress", ProgressBar)
-        status = self.query_one("#status", Static)
-
-        # Run simulation in batches for progress updates
-        batch_size = max(1, self.num_games // 100)
-        completed = 0
-
-        for batch_start in range(0, self.num_games, batch_size):
-            batch_end = min(batch_start + batch_size, self.num_games)
-
-            # Run batch
-            for _ in range(batch_start, batch_end):
-                # Generate game data
-                car_door = random.randint(0, self.num_doors - 1)
-                player_choice = random.randint(0, self.num_doors - 1)
-
-                self.results.car_door_counts[car_door] += 1
-                self.results.player_choice_counts[player_choice] += 1
-
-                # Test switching strategy
-                if self.simulate_game_outcome(True, car_door, player_choice):
-                    self.results.switch_wins += 1
-
-                # Test staying strategy
-                if self.simulate_game_outcome(False, car_door, player_choice):
-                    self.results.stay_wins += 1
-
-                completed += 1
-
-            # Update progress
-            progress.update(progress=completed / self.num_games * 100)
-            status.update(f"Completed {completed:,} / {self.num_games:,} games...")
-            await asyncio.sleep(0.01)  # Allow UI updates
-
-        # Show results
-        await self.show_results()
-
-    def simulate_game_outcome(
-        self, switch_strategy: bool, car_door: int, player_choice: int
-    ) -> bool:
-        """Simulate a single game outcome"""
-        # Determine which doors Monty opens
-        doors_to_keep_closed = {car_door}
-        if player_choice != car_door:
-            doors_to_keep_closed.add(player_choice)
-        else:
-            other_doors = [i for i in range(self.num_doors) if i != car_door]
-            doors_to_keep_closed.add(random.choice(other_doors))
-
-        available_doors = [
-            i for i in range(self.num_doors) if i in doors_to_keep_closed
-        ]
-
-        if switch_strategy:
-            # Switch to a different available door
-            switch_options = [d for d in available_doors if d != player_choice]
-            final_choice = (
-                random.choice(switch_options) if switch_options else player_choice
-            )
-        else:
-            # Stay with original choice
-            final_choice = player_choice
+_mh_library = None
 
-        return final_choice == car_door
 
-    async def show_results(self):
-        """Display the simulation results"""
-        if not self.results:
-            return
-
-        results_container = self.query_one("#results-container", Container)
-        results_container.remove_children()
-
-        # Main results
-        switch_rate = self.results.switch_rate * 100
-        stay_rate = self.results.stay_rate * 100
-        theo_switch = self.results.theoretical_switch_rate * 100
-        theo_stay = self.results.theoretical_stay_rate * 100
-
-        await results_container.mount(
-            Static("[bold green]SIMULATION COMPLETE![/]", classes="success"),
-            Rule(),
-            Static(f"[bold]Strategy Results:[/]"),
-            Static(
-                f"Switch: [green]{switch_rate:.1f}%[/] (theory: {theo_switch:.1f}%)"
-            ),
-            Static(f"Stay:   [red]{stay_rate:.1f}%[/] (theory: {theo_stay:.1f}%)"),
-            Static(f"Switch advantage: [bold]{switch_rate/stay_rate:.1f}x[/]"),
-            Rule(),
-            Collapsible(
-                self.create_detailed_stats(),
-                title="Detailed Statistics",
-                collapsed=False,
-            ),
-        )
-
-        self.query_one("#status", Static).update(
-            "[bold green]Simulation complete![/] Press ESC to return to menu."
-        )
-
-    def create_detailed_stats(self) -> Container:
-        """Create detailed statistics display"""
-        if not self.results:
-            return Container()
-
-        # Create data table for door distributions
-        table = DataTable()
-        table.add_column("Door", width=8)
-        table.add_column("Car Location", width=15)
-        table.add_column("Player Choice", width=15)
-        table.add_column("Expected %", width=12)
-
-        expected_pct = 100 / self.num_doors
-        for door in range(self.num_doors):
-            car_pct = (
-                self.results.car_door_counts[door] / self.results.num_games
-            ) * 100
-            choice_pct = (
-                self.results.player_choice_counts[door] / self.results.num_games
-            ) * 100
-
-            table.add_row(
-                str(door),
-                f"{car_pct:.1f}%",
-                f"{choice_pct:.1f}%",
-                f"{expected_pct:.1f}%",
-            )
-
-        return Container(
-            Static("[bold]Door Distribution Analysis:[/]"),
-            table,
-            classes="stats-container",
-        )
-
-    def action_back(self) -> None:
-        self.app.pop_screen()
-
-
-class InteractiveGameScreen(Screen):
-    """Screen for playing the interactive Monty Hall game"""
-
-    BINDINGS = [Binding("escape", "back", "Back to Menu")]
-
-    def __init__(self, num_doors: int = 3):
-        super().__init__()
-        self.num_doors = num_doors
-
-        # Game state for current game
-        self.car_door = None
-        self.initial_choice = None
-        self.doors_opened_by_host = set()
-        self.final_choice = None
-        self.game_phase = (
-            "initial"  # "initial", "host_opens", "final_choice", "game_over"
-        )
-        self.countdown_active = False
-        self.countdown_seconds = 0
-
-        # Overall statistics tracking
-        self.total_games = 0
-        self.total_wins = 0
-        self.total_losses = 0
-        self.switch_wins = 0
-        self.switch_losses = 0
-        self.stay_wins = 0
-        self.stay_losses = 0
-
-        # Round tracking
-        self.current_round = 1
-        self.games_in_current_round = 0
-        self.wins_in_current_round = 0
-        self.rounds_played = 0
-        self.rounds_won = 0
-
-    def compose(self) -> ComposeResult:
-        yield Header(show_clock=True)
-        yield Container(
-            Static(
-                f"[bold blue]Interactive Monty Hall Game[/] - {self.num_doors} doors",
-                classes="title",
-            ),
-            Rule(),
-            Container(id="game-container"),
-            Container(id="stats-container"),  # Only one container for all stats
-            classes="game-screen",
-        )
-        yield Footer()
-
-    async def on_mount(self) -> None:
-        await self.start_new_game()
-        self.update_stats_display()
-        self.update_round_display()
-
-    async def start_new_game(self):
-        """Start a new game"""
-        print(f"DEBUG: Starting new game in round {self.current_round}")
-        self.car_door = random.randint(0, self.num_doors - 1)
-        self.initial_choice = None
-        self.doors_opened_by_host = set()
-        self.final_choice = None
-        self.game_phase = "initial"
-        self.games_in_current_round += 1
-        print(f"DEBUG: Car is behind door {self.car_door}")
-        print(
-            f"DEBUG: Game #{self.games_in_current_round} in round {self.current_round}"
-        )
-        await self.show_game_interface()
-
-    async def start_new_round(self):
-        """Start a new round - check if current round was won, then reset round stats"""
-        print(f"DEBUG: Starting new round (was round {self.current_round})")
-        # Check if current round was won (player won more than half the games)
-        if self.games_in_current_round > 0:
-            self.rounds_played += 1
-            if self.wins_in_current_round > self.games_in_current_round / 2:
-                self.rounds_won += 1
-                print(
-                    f"DEBUG: Round {self.current_round} was WON ({self.wins_in_current_round}/{self.games_in_current_round})"
-                )
-            else:
-                print(
-                    f"DEBUG: Round {self.current_round} was LOST ({self.wins_in_current_round}/{self.games_in_current_round})"
-                )
-
-        # Start new round
-        self.current_round += 1
-        self.games_in_current_round = 0
-        self.wins_in_current_round = 0
-        print(f"DEBUG: Now starting round {self.current_round}")
-        self.update_round_display()
-        await self.start_new_game()
-
-    async def restart_current_round(self):
-        """Restart the current round - reset round stats but keep round number"""
-        print(f"DEBUG: Restarting current round {self.current_round}")
-        self.games_in_current_round = 0
-        self.wins_in_current_round = 0
-        self.update_round_display()
-        await self.start_new_game()
-
-    def update_stats_display(self):
-        """Update the statistics display with all information combined"""
-        stats_container = self.query_one("#stats-container", Container)
-        stats_container.remove_children()
-
-        # Calculate statistics
-        win_rate = (
-            (self.total_wins / self.total_games * 100) if self.total_games > 0 else 0
-        )
-        switch_win_rate = (
-            (self.switch_wins / (self.switch_wins + self.switch_losses) * 100)
-            if (self.switch_wins + self.switch_losses) > 0
-            else 0
-        )
-        stay_win_rate = (
-            (self.stay_wins / (self.stay_wins + self.stay_losses) * 100)
-            if (self.stay_wins + self.stay_losses) > 0
-            else 0
-        )
-
-        # Get round statistics
-        round_win_rate = (
-            (self.wins_in_current_round / self.games_in_current_round * 100)
-            if self.games_in_current_round > 0
-            else 0
-        )
-        overall_round_win_rate = (
-            (self.rounds_won / self.rounds_played * 100)
-            if self.rounds_played > 0
-            else 0
-        )
-
-        # Create buttons container
-        buttons_container = Horizontal(
-            Button("New Game", id="new-game", classes="round-button"),
-            Button("Restart Round", id="restart-round", classes="round-button"),
-            Button("New Round", id="new-round", classes="round-button"),
-            classes="round-buttons",
-        )
-
-        # Mount all elements in one container
-        stats_container.mount(
-            Rule(),
-            Static("[bold]Game Statistics:[/]", classes="stats-title"),
-            Static(f"Total games: {self.total_games}"),
-            Static(f"Total wins: {self.total_wins} ({win_rate:.1f}%)"),
-            Static(
-                f"Switch strategy: {self.switch_wins}W-{self.switch_losses}L ({switch_win_rate:.1f}%)"
-            ),
-            Static(
-                f"Stay strategy: {self.stay_wins}W-{self.stay_losses}L ({stay_win_rate:.1f}%)"
-            ),
-            Rule(),
-            Static("[bold]Current Round:[/]", classes="round-title"),
-            Static(f"Round #{self.current_round}"),
-            Static(f"Games in round: {self.games_in_current_round}"),
-            Static(
-                f"Wins in round: {self.wins_in_current_round} ({round_win_rate:.1f}%)"
-            ),
-            Rule(),
-            Static("[bold]Round History:[/]", classes="round-title"),
-            Static(f"Rounds played: {self.rounds_played}"),
-            Static(f"Rounds won: {self.rounds_won} ({overall_round_win_rate:.1f}%)"),
-            buttons_container,
-            Rule(),
-        )
-        self.refresh()
-
-    def update_round_display(self):
-        """Update the round information display - now combined with stats"""
-        self.update_stats_display()
-
-    async def show_game_interface(self):
-        """Show the main game interface based on current phase"""
-        game_container = self.query_one("#game-container", Container)
-        game_container.remove_children()
-
-        if self.game_phase == "initial":
-            await self.show_initial_choice()
-        elif self.game_phase == "host_opens":
-            await self.show_host_opens()
-        elif self.game_phase == "final_choice":
-            await self.show_final_choice()
-        elif self.game_phase == "game_over":
-            await self.show_game_result()
-
-    async def show_initial_choice(self):
-        """Show initial door selection phase"""
-        game_container = self.query_one("#game-container", Container)
-
-        # Create door buttons
-        door_buttons = []
-        for i in range(self.num_doors):
-            door_buttons.append(
-                Button(f"Door {i}", id=f"door-{i}", classes="door-button")
-            )
-        doors_container = Horizontal(*door_buttons, classes="doors-container")
-
-        prob_correct = (1 / self.num_doors) * 100
-        prob_others = ((self.num_doors - 1) / self.num_doors) * 100
-
-        await game_container.mount(
-            Static(
-                f"[bold]Round #{self.current_round} - Game #{self.games_in_current_round}[/]"
-            ),
-            Static("[bold]Phase 1: Choose your initial door[/]"),
-            doors_container,
-            Static("🚗 One door has a car, the others have goats! 🐐"),
-            Rule(),
-            Static(
-                f"💡 [dim]Your choice has {prob_correct:.1f}% chance of being correct[/]"
-            ),
-            Static(
-                f"💡 [dim]The other {self.num_doors-1} doors combined have {prob_others:.1f}% chance[/]"
-            ),
-        )
+def _load_mh_library():
+    """Load the native _mh simulator built from _mh.c, or return None"""
+    global _mh_library
+    if _mh_library is not None:
+        return _mh_library
 
-    async def show_host_opens(self):
-        """Show host opening doors phase"""
-        game_container = self.query_one("#game-container", Container)
-
-        # Host opens N-2 doors (all doors except player's choice and one other)
-        doors_to_keep_closed = {self.car_door}
-        if self.initial_choice != self.car_door:
-            # If player didn't choose car, keep their door closed too
-            doors_to_keep_closed.add(self.initial_choice)
-        else:
-            # If player chose car, keep one random other door closed
-            other_doors = [i for i in range(self.num_doors) if i != self.car_door]
-            doors_to_keep_closed.add(random.choice(other_doors))
-
-        # Open all other doors
-        for door in range(self.num_doors):
-            if door not in doors_to_keep_closed:
-                self.doors_opened_by_host.add(door)
-
-        # Show door states
-        door_displays = []
-        for i in range(self.num_doors):
-            if i == self.initial_choice:
-                door_displays.append(f"[bold green]Door {i}: YOUR CHOICE[/]")
-            elif i in self.doors_opened_by_host:
-                door_displays.append(f"[red]Door {i}: 🐐 GOAT (opened by host)[/]")
-            else:
-                door_displays.append(f"[yellow]Door {i}: ? UNKNOWN[/]")
-
-        doors_text = "\n".join(door_displays)
-
-        remaining_doors = [
-            i for i in range(self.num_doors) if i not in self.doors_opened_by_host
-        ]
-        other_door = [d for d in remaining_doors if d != self.initial_choice][0]
-
-        await game_container.mount(
-            Static(
-                f"[bold]Round #{self.current_round} - Game #{self.games_in_current_round}[/]"
-            ),
-            Static("[bold]Phase 2: Host opens doors with goats[/]"),
-            Static(doors_text),
-            Rule(),
-            Static(
-                f"[bold]The host opened {len(self.doors_opened_by_host)} doors with goats![/]"
-            ),
-            Static(
-                f"[bold]Only 2 doors remain: your choice (Door {self.initial_choice}) and Door {other_door}[/]"
-            ),
-            Button(
-                "Continue to Final Choice", id="continue", classes="continue-button"
-            ),
-        )
-
-    async def show_final_choice(self):
-        """Show final choice phase (stay or switch)"""
-        game_container = self.query_one("#game-container", Container)
-
-        remaining_doors = [
-            i for i in range(self.num_doors) if i not in self.doors_opened_by_host
+    here = os.path.dirname(os.path.abspath(__file__))
+    for name in ("_mh.so", "_mh.dylib", "_mh.dll"):
+        path = os.path.join(here, name)
+        if not os.path.exists(path):
+            continue
+        try:
+            library = ctypes.CDLL(path)
+        except OSError:  # Stale or foreign build, fall back to Python paths
+            continue
+
+        counts = np.ctypeslib.ndpointer(dtype=np.uint64, flags="C_CONTIGUOUS")
+        wins = ctypes.POINTER(ctypes.c_uint64)
+        library.mh_simulate.argtypes = [
+            ctypes.c_uint64,
+            ctypes.c_int,
+            ctypes.c_uint64,
+            wins,
+            wins,
+            counts,
+            counts,
         ]
-        other_door = [d for d in remaining_doors if d != self.initial_choice][0]
-
-        # Show door states
-        door_displays = []
-        for i in range(self.num_doors):
-            if i == self.initial_choice:
-                door_displays.append(f"[bold green]Door {i}: YOUR ORIGINAL CHOICE[/]")
-            elif i in self.doors_opened_by_host:
-                door_displays.append(f"[dim red]Door {i}: 🐐 GOAT (opened)[/]")
-            elif i == other_door:
-                door_displays.append(f"[bold yellow]Door {i}: SWITCH OPTION[/]")
-
-        doors_text = "\n".join(door_displays)
-
-        prob_stay = (1 / self.num_doors) * 100
-        prob_switch = ((self.num_doors - 1) / self.num_doors) * 100
-
-        await game_container.mount(
-            Static(
-                f"[bold]Round #{self.current_round} - Game #{self.games_in_current_round}[/]"
-            ),
-            Static("[bold]Phase 3: Final Decision - Stay or Switch?[/]"),
-            Static(doors_text),
-            Rule(),
-            Static("[bold]Now you must make your final choice:[/]"),
-            Horizontal(
-                Button(
-                    f"STAY with Door {self.initial_choice}",
-                    id="stay",
-                    classes="stay-button",
-                ),
-                Button(
-                    f"SWITCH to Door {other_door}", id="switch", classes="switch-button"
-                ),
-            ),
-            Rule(),
-            Static(f"💡 [dim]Probability of winning if you STAY: {prob_stay:.1f}%[/]"),
-            Static(
-                f"💡 [dim]Probability of winning if you SWITCH: {prob_switch:.1f}%[/]"
-            ),
-        )
-
-    async def show_game_result(self):
-        """Show the final game result"""
-        game_container = self.query_one("#game-container", Container)
-
-        if self.countdown_active:
-            if self.final_choice == self.car_door:
-                status_msg = f"[bold green]🎉 YOU WON! 🎉 Next game starting in {self.countdown_seconds} seconds...[/]"
-            else:
-                status_msg = f"[bold red]😞 You lost. Next game starting in {self.countdown_seconds} seconds...[/]"
-        else:
-            won = self.final_choice == self.car_door
-            if won:
-                status_msg = "[bold green]🎉 CONGRATULATIONS! YOU WON THE CAR! 🎉[/]"
-            else:
-                status_msg = (
-                    "[bold red]😞 Sorry, you got a goat. Better luck next time![/]"
-                )
-
-        # Show all door contents
-        door_reveals = []
-        for i in range(self.num_doors):
-            if i == self.car_door:
-                door_reveals.append(f"[bold green]Door {i}: 🚗 CAR[/]")
-            else:
-                door_reveals.append(f"[red]Door {i}: 🐐 GOAT[/]")
-
-        doors_text = "\n".join(door_reveals)
-
-        strategy = "SWITCHED" if self.final_choice != self.initial_choice else "STAYED"
-
-        if not self.countdown_active:
-            buttons = Horizontal(
-                Button("New Game", id="new-game", classes="play-again-button"),
-                Button(
-                    "Restart Round", id="restart-round", classes="play-again-button"
-                ),
-                Button("New Round", id="new-round", classes="play-again-button"),
-                classes="result-buttons",
+        library.mh_simulate.restype = None
+
+        def simulate(num_games, num_doors):
+            stay_wins = ctypes.c_uint64()
+            switch_wins = ctypes.c_uint64()
+            car_counts = np.zeros(num_doors, dtype=np.uint64)
+            choice_counts = np.zeros(num_doors, dtype=np.uint64)
+            library.mh_simulate(
+                num_games,
+                num_doors,
+                int(RNG.integers(0, 2**63)),
+                ctypes.byref(stay_wins),
+                ctypes.byref(switch_wins),
+                car_counts,
+                choice_counts,
             )
-        else:
-            buttons = Container()  # No buttons during countdown
-
-        await game_container.mount(
-            Static(
-                f"[bold]Round #{self.current_round} - Game #{self.games_in_current_round}[/]"
-            ),
-            Static(status_msg, classes="result-message"),
-            Rule(),
-            Static("[bold]Final Results:[/]"),
-            Static(doors_text),
-            Rule(),
-            Static(f"[bold]Your journey:[/]"),
-            Static(f"• Initial choice: Door {self.initial_choice}"),
-            Static(f"• Final choice: Door {self.final_choice}"),
-            Static(f"• Strategy: {strategy}"),
-            Static(f"• Car was behind: Door {self.car_door}"),
-            Rule(),
-            buttons,
-        )
-
-    def on_button_pressed(self, event: Button.Pressed) -> None:
-        """Handle button presses"""
-        button_id = event.button.id or ""
-        print(f"DEBUG: Button pressed: {button_id}")
-        print(f"DEBUG: game_phase = {self.game_phase}")
-        print(f"DEBUG: countdown_active = {self.countdown_active}")
-
-        if self.countdown_active:
-            print("DEBUG: Ignoring button press - countdown active")
-            return
-
-        if button_id.startswith("door-") and self.game_phase == "initial":
-            door_num = int(button_id.split("-")[1])
-            print(f"DEBUG: Initial choice - Door {door_num}")
-            self.initial_choice = door_num
-            self.game_phase = "host_opens"
-            self.call_later(self.show_game_interface)
-
-        elif button_id == "continue" and self.game_phase == "host_opens":
-            print("DEBUG: Moving to final choice phase")
-            self.game_phase = "final_choice"
-            self.call_later(self.show_game_interface)
-
-        elif button_id == "stay" and self.game_phase == "final_choice":
-            print("DEBUG: Player chose to STAY")
-            self.final_choice = self.initial_choice
-            self.record_game_result("stay")
-
-        elif button_id == "switch" and self.game_phase == "final_choice":
-            print("DEBUG: Player chose to SWITCH")
-            remaining_doors = [
-                i for i in range(self.num_doors) if i not in self.doors_opened_by_host
-            ]
-            self.final_choice = [
-                d for d in remaining_doors if d != self.initial_choice
-            ][0]
-            self.record_game_result("switch")
-
-        elif button_id == "new-game":
-            print("DEBUG: New game button pressed")
-            self.call_later(self.start_new_game)
-        elif button_id == "restart-round":
-            print("DEBUG: Restart round button pressed")
-            self.call_later(self.restart_current_round)
-        elif button_id == "new-round":
-            print("DEBUG: New round button pressed")
-            self.call_later(self.start_new_round)
-        else:
-            print(f"DEBUG: Unhandled button: {button_id}")
-
-    def record_game_result(self, strategy):
-        """Record the result of the completed game"""
-        print(f"DEBUG: Recording game result - strategy: {strategy}")
-
-        self.total_games += 1
-        won = self.final_choice == self.car_door
-
-        if won:
-            self.total_wins += 1
-            self.wins_in_current_round += 1
-            if strategy == "switch":
-                self.switch_wins += 1
-            else:
-                self.stay_wins += 1
-        else:
-            self.total_losses += 1
-            if strategy == "switch":
-                self.switch_losses += 1
-            else:
-                self.stay_losses += 1
-
-        self.game_phase = "game_over"
-
-        # Update displays
-        self.update_stats_display()
-        self.update_round_display()
-
-        # Always start countdown (for both wins and losses)
-        self.run_worker(self.start_game_countdown(won), exclusive=True)
-
-    async def start_game_countdown(self, won):
-        """Start 5-second countdown after game ends, then start new game"""
-        print(f"DEBUG: Starting game countdown - won: {won}")
-        self.countdown_active = True
-        self.countdown_seconds = 5
-
-        # Update displays to show the result
-        await self.show_game_interface()
-
-        # Countdown loop
-        for i in range(5, 0, -1):
-            print(f"DEBUG: Countdown: {i}")
-            self.countdown_seconds = i
-            await self.show_game_interface()
-            await asyncio.sleep(1)
-
-        # Reset countdown and start new game
-        print("DEBUG: Countdown finished, starting new game")
-        self.countdown_active = False
-        self.countdown_seconds = 0
-        await self.start_new_game()
-
-    def action_back(self) -> None:
-        self.app.pop_screen()
-
-
-class SettingsModal(ModalScreen[tuple[int, int]]):
-    """Modal for simulation settings"""
-
-    def compose(self) -> ComposeResult:
-        yield Container(
-            Static("[bold]Simulation Settings[/]", classes="modal-title"),
-            Rule(),
-            Label("Number of doors (minimum 3):"),
-            Input(value="3", id="doors-input"),
-            Label("Number of games:"),
-            Input(value="10000", id="games-input"),
-            Rule(),
-            Horizontal(
-                Button("Start Simulation", variant="primary", id="start"),
-                Button("Cancel", id="cancel"),
-                classes="button-row",
-            ),
-            classes="settings-modal",
-        )
-
-    def on_button_pressed(self, event: Button.Pressed) -> None:
-        if event.button.id == "start":
-            doors_input = self.query_one("#doors-input", Input)
-            games_input = self.query_one("#games-input", Input)
-
-            try:
-                doors = max(3, int(doors_input.value))
-                games = max(1, int(games_input.value))
-                self.dismiss((games, doors))
-            except ValueError:
-                # Invalid input, keep modal open
-                doors_input.focus()
-        elif event.button.id == "cancel":
-            self.dismiss(None)
-
-
-class GameSettingsModal(ModalScreen[int]):
-    """Modal for interactive game settings"""
-
-    def compose(self) -> ComposeResult:
-        yield Container(
-            Static("[bold]Game Settings[/]", classes="modal-title"),
-            Rule(),
-            Label("Number of doors (minimum 3):"),
-            Input(value="3", id="doors-input"),
-            Rule(),
-            Horizontal(
-                Button("Start Game", variant="primary", id="start"),
-                Button("Cancel", id="cancel"),
-                classes="button-row",
-            ),
-            classes="settings-modal",
-        )
-
-    def on_button_pressed(self, event: Button.Pressed) -> None:
-        if event.button.id == "start":
-            doors_input = self.query_one("#doors-input", Input)
-
-            try:
-                doors = max(3, int(doors_input.value))
-                self.dismiss(doors)
-            except ValueError:
-                doors_input.focus()
-        elif event.button.id == "cancel":
-            self.dismiss(None)
-
-
-class MontyHallApp(App):
-    """Main Monty Hall TUI Application"""
-
-    CSS = """
-    .title {
-        text-align: center;
-        padding: 1;
-    }
-    
-    .menu-container {
-        align: center middle;
-        max-width: 60;
-    }
-    
-    .menu-button {
-        width: 100%;
-        margin: 1;
-    }
-    
-    .doors-container {
-        align: center middle;
-        padding: 2;
-    }
-    
-    .door-button {
-        margin: 0 1;
-        min-width: 12;
-    }
-    
-    .choice-buttons {
-        align: center middle;
-        padding: 1;
-    }
-    
-    .choice-button {
-        margin: 0 1;
-        min-width: 30;  /* Increased minimum width */
-        text-align: center;  /* Center the text */
-    }
-    
-    .stay-button {
-        background: red 30%;
-        color: white;  /* Added white text color */
-    }
-    
-    .switch-button {
-        background: green 30%;
-        color: white;  /* Added white text color */
-    }
-    
-    .play-again-button {
-        dock: bottom;
-        margin: 1;
-        background: blue;
-        color: white;  /* Added white text color */
-    }
-    
-    .result-message {
-        text-align: center;
-        padding: 1;
-    }
-    
-    .settings-modal {
-        align: center middle;
-        background: $panel;
-        border: thick $primary;
-        width: 50;
-        height: auto;
-        padding: 1;
-    }
-    
-    .modal-title {
-        text-align: center;
-        padding-bottom: 1;
-    }
-    
-    .button-row {
-        align: center middle;
-        padding-top: 1;
-    }
-    
-    .success {
-        color: green;
-        text-align: center;
-    }
-    
-    .stats-container {
-        padding: 1;
-    }
-    
-    .stats-title {
-        text-align: center;
-        padding: 1;
-    }
-    
-    .round-title {
-        text-align: center;
-        padding: 1;
-    }
-    
-    .round-buttons {
-        align: center middle;
-        padding: 1;
-    }
-    
-    .round-button {
-        margin: 0 1;
-        background: $primary 30%;
-        color: white;  /* Added white text color */
-    }
-    
-    .result-buttons {
-        align: center middle;
-        padding: 1;
-    }
-    """
-
-    BINDINGS = [Binding("q", "quit", "Quit"), Binding("ctrl+c", "quit", "Quit")]
-
-    def compose(self) -> ComposeResult:
-        yield Header(show_clock=True)
-        yield Container(
-            Static("[bold blue]🎰 MONTY HALL PROBLEM SIMULATOR 🎰[/]", classes="title"),
-            Static("[dim]The famous probability puzzle![/]", classes="title"),
-            Rule(),
-            Container(
-                Button(
-                    "📊 Statistical Simulation", id="simulation", classes="menu-button"
-                ),
-                Button("🎮 Interactive Game", id="game", classes="menu-button"),
-                Button("❓ About", id="about", classes="menu-button"),
-                Button("🚪 Quit", id="quit", classes="menu-button"),
-                classes="menu-container",
-            ),
-            classes="main-menu",
+            return switch_wins.value, stay_wins.value, car_counts, choice_counts
+
+        _mh_library = simulate
+        return _mh_library
+
+    return None
+
+
+# Below this many games the Numba compile cost outweighs the speedup
+NUMBA_MIN_GAMES = 100_000
+
+_mh_kernel = None
+
+
+def _load_mh_kernel():
+    """Build the Numba simulator on first use, or return None without Numba"""
+    global _mh_kernel
+    if _mh_kernel is not None:
+        return _mh_kernel
+
+    try:
+        from numba import get_num_threads, njit, prange
+    except ImportError:  # Numba is optional, NumPy is used instead
+        return None
+
+    # The compiled loop only beats NumPy's bulk draws when it can fan out
+    if get_num_threads() < 2:
+        return None
+
+    @njit(cache=True, parallel=True)
+    def kernel(num_games, num_doors, seed, num_chunks):
+        """Compiled Monty Hall loop returning wins and per-door counts"""
+        stay = np.zeros(num_chunks, dtype=np.int64)
+        car_counts = np.zeros((num_chunks, num_doors), dtype=np.int64)
+        choice_counts = np.zeros((num_chunks, num_doors), dtype=np.int64)
+
+        # Each chunk runs on its own thread with its own RNG state, counting
+        # into locals so threads never write to shared cache lines per game
+        for chunk in prange(num_chunks):
+            np.random.seed(seed + chunk)
+            start = chunk * num_games // num_chunks
+            end = (chunk + 1) * num_games // num_chunks
+            local_stay = 0
+            local_car = np.zeros(num_doors, dtype=np.int64)
+            local_choice = np.zeros(num_doors, dtype=np.int64)
+            for _ in range(start, end):
+                car = np.random.randint(0, num_doors)
+                choice = np.random.randint(0, num_doors)
+                if car == choice:
+                    local_stay += 1
+                local_car[car] += 1
+                local_choice[choice] += 1
+            stay[chunk] = local_stay
+            car_counts[chunk] = local_car
+            choice_counts[chunk] = local_choice
+
+        stay_wins = stay.sum()
+        return (
+            num_games - stay_wins,
+            stay_wins,
+            car_counts.sum(axis=0),
+            choice_counts.sum(axis=0),
         )
-        yield Footer()
-
-    def on_button_pressed(self, event: Button.Pressed) -> None:
-        button_id = event.button.id
 
-        if button_id == "simulation":
+    def simulate(num_games, num_doors):
+        seed = int(RNG.integers(0, 2**31))
+        return kernel(num_games, num_doors, seed, get_num_threads())
 
-            def check_simulation_result(result):
-                if result:
-                    games, doors = result
-                    self.push_screen(SimulationScreen(games, doors))
-
-            self.push_screen(SettingsModal(), check_simulation_result)
-
-        elif button_id == "game":
-
-            def check_game_result(doors):
-                if doors:
-                    self.push_screen(InteractiveGameScreen(doors))
-
-            self.push_screen(GameSettingsModal(), check_game_result)
-
-        elif button_id == "about":
-            self.show_about()
-
-        elif button_id == "quit":
-            self.exit()
-
-    def show_about(self):
-        """Show about information"""
-        about_text = """[bold blue]The Monty Hall Problem[/bold blue]
-
-Named after game show host Monty Hall, this famous probability puzzle demonstrates counter-intuitive statistics.
-
-[bold]The Setup:[/bold]
-• You choose one of three doors (one has a car, others have goats)
-• Monty opens a door with a goat (not your choice, not the car)
-• You can switch to the remaining door or stay with your choice
-
-[bold]The Surprise:[/bold]
-• Staying gives you a 1/3 (33.3%) chance of winning
-• Switching gives you a 2/3 (66.7%) chance of winning!
-
-[bold]Why?[/bold]
-Your initial choice had a 1/3 chance of being correct. When Monty eliminates a wrong door, the remaining door gets the combined probability of all the doors you didn't pick: 2/3!
-
-With more doors, this effect becomes even more dramatic. With 100 doors, staying gives you 1% chance, while switching gives you 99% chance!
-
-This simulator lets you run statistical simulations and play interactively to experience the puzzle firsthand.
-
-Press ESC to return to the menu."""
-
-        # Create a simple screen for about info
-        class AboutScreen(Screen):
-            BINDINGS = [Binding("escape", "back", "Back")]
-
-            def compose(self):
-                yield Header()
-                yield Container(
-                    Static(about_text, classes="about-text"), classes="about-container"
-                )
-                yield Footer()
-
-            def action_back(self):
-                self.app.pop_screen()
-
-        self.push_screen(AboutScreen())
+    _mh_kernel = simulate
+    return _mh_kernel
 
 
 def monty_hall_game_simple(switch_strategy: bool, num_doors: int = 3) -> bool:
-    """Simple version for command line mode"""
-    car_door = random.randint(0, num_doors - 1)
-    player_choice = random.randint(0, num_doors - 1)
-
-    # Monty's doors
-    doors_to_keep_closed = {car_door}
-    if player_choice != car_door:
-        doors_to_keep_closed.add(player_choice)
-    else:
-        other_doors = [i for i in range(num_doors) if i != car_door]
-        doors_to_keep_closed.add(random.choice(other_doors))
-
-    available_doors = list(doors_to_keep_closed)
+    """Play a single game (kept for API compatibility, not used by the CLI)"""
+    car_door, player_choice = RNG.integers(0, num_doors, size=2)
 
+    # Switching wins iff the first pick missed, whichever goats Monty opens
     if switch_strategy:
-        switch_options = [d for d in available_doors if d != player_choice]
-        final_choice = (
-            random.choice(switch_options) if switch_options else player_choice
-        )
-    else:
-        final_choice = player_choice
-
-    return final_choice == car_door
+        return bool(player_choice != car_door)
+    return bool(player_choice == car_door)
 
 
 def run_simple_simulation(num_games: int, num_doors: int, quiet: bool = False):
     """Simple command-line simulation"""
-    switch_wins = sum(monty_hall_game_simple(True, num_doors) for _ in range(num_games))
-    stay_wins = sum(monty_hall_game_simple(False, num_doors) for _ in range(num_games))
+    kernel = _load_mh_library()
+    if kernel is None and num_games >= NUMBA_MIN_GAMES:
+        kernel = _load_mh_kernel()
+    if kernel is not None:
+        switch_wins, stay_wins, _, _ = kernel(num_games, num_doors)
+        switch_wins, stay_wins = int(switch_wins), int(stay_wins)
+    else:
+        # Fixed-size chunks keep memory bounded however many games are run
+        chunk_size = min(CLI_CHUNK_SIZE, num_games)
+        scratch = np.empty(chunk_size, dtype=np.intp)
+        switch_wins = stay_wins = 0
+        for chunk_start in range(0, num_games, chunk_size):
+            chunk = min(chunk_size, num_games - chunk_start)
+            stay_w, switch_w, _, _ = run_batch(RNG, chunk, num_doors, scratch)
+            stay_wins += int(stay_w)
+            switch_wins += int(switch_w)
 
     switch_rate = switch_wins / num_games
     stay_rate = stay_wins / num_games
@@ -1155,8 +362,11 @@ Examples:
             parser.error("Number of games must be positive")
         run_simple_simulation(args.simulate, args.doors, args.quiet)
     else:
-        # TUI mode (default)
+        # TUI mode (default), Textual is only imported here
         try:
+            # Imports `montyhall` afresh, separate from this __main__ copy
+            from montyhall_tui import MontyHallApp
+
             app = MontyHallApp()
             app.run()
         except ImportError:
@@ -0,0 +1,919 @@
+"""Textual TUI for the Monty Hall simulator, imported only when the TUI runs"""
+
+import random
+import asyncio
+from time import monotonic
+from typing import Optional
+
+import numpy as np
+
+# Textual imports
+from textual.app import App, ComposeResult
+from textual.containers import Container, Horizontal, Vertical, Center
+from textual.widgets import (
+    Header,
+    Footer,
+    Button,
+    Static,
+    Input,
+    Label,
+    ProgressBar,
+    DataTable,
+    Tabs,
+    TabPane,
+    Pretty,
+    Collapsible,
+    Rule,
+)
+from textual.screen import Screen, ModalScreen
+from textual.binding import Binding
+from textual.reactive import reactive, var
+from textual import events
+
+from montyhall import CLI_CHUNK_SIZE, RNG, SimulationResults, run_batch
+
+
+class SimulationScreen(Screen):
+    """Screen for running statistical simulations"""
+
+    BINDINGS = [Binding("escape", "back", "Back to Menu")]
+
+    # Games simulated so far, the progress widgets redraw when it changes
+    completed = var(0, init=False)
+
+    def __init__(self, num_games: int = 10000, num_doors: int = 3):
+        super().__init__()
+        self.num_games = num_games
+        self.num_doors = num_doors
+        self.results: Optional[SimulationResults] = None
+
+    def compose(self) -> ComposeResult:
+        yield Header(show_clock=True)
+        yield Container(
+            Static(
+                f"[bold blue]Statistical Simulation[/] - {self.num_games:,} games with {self.num_doors} doors",
+                classes="title",
+            ),
+            Rule(),
+            Static("Running simulation...", id="status"),
+            ProgressBar(id="progress"),
+            Container(id="results-container"),
+            classes="simulation-screen",
+        )
+        yield Footer()
+
+    async def on_mount(self) -> None:
+        await self.run_simulation()
+
+    async def run_simulation(self):
+        """Run the simulation with progress updates"""
+        self.results = SimulationResults(self.num_games, self.num_doors)
+
+        # Run simulation in batches big enough to amortize the UI round-trip,
+        # but capped so memory stays bounded for huge runs
+        batch_size = min(CLI_CHUNK_SIZE, max(10_000, self.num_games // 30))
+        scratch = np.empty(min(batch_size, self.num_games), dtype=np.intp)
+        completed = 0
+        last_update = monotonic()
+
+        for batch_start in range(0, self.num_games, batch_size):
+            batch_end = min(batch_start + batch_size, self.num_games)
+
+            # Run batch off the event loop so the UI keeps redrawing
+            batch = batch_end - batch_start
+            stay_w, switch_w, car_counts, choice_counts = await asyncio.to_thread(
+                run_batch, RNG, batch, self.num_doors, scratch
+            )
+            self.results.stay_wins += stay_w
+            self.results.switch_wins += switch_w
+            self.results.car_door_counts += car_counts
+            self.results.player_choice_counts += choice_counts
+
+            completed += batch
+
+            # Publish progress at most every 50 ms
+            if monotonic() - last_update > 0.05 or completed == self.num_games:
+                self.completed = completed
+                last_update = monotonic()
+
+        # Show results
+        await self.show_results()
+
+    def watch_completed(self, completed: int) -> None:
+        """Redraw the progress bar and status line"""
+        self.query_one("#progress", ProgressBar).update(
+            progress=completed / self.num_games * 100
+        )
+        self.query_one("#status", Static).update(
+            f"Completed {completed:,} / {self.num_games:,} games..."
+        )
+
+    def simulate_game_outcome(
+        self, switch_strategy: bool, car_door: int, player_choice: int
+    ) -> bool:
+        """Simulate a single game outcome"""
+        # Monty leaves the car and one other door closed, so the door a
+        # switcher lands on is the car iff the first pick wasn't. Which goat
+        # door he leaves closed never changes the outcome, so it isn't drawn
+        if switch_strategy:
+            return player_choice != car_door
+        return player_choice == car_door
+
+    async def show_results(self):
+        """Display the simulation results"""
+        if not self.results:
+            return
+
+        results_container = self.query_one("#results-container", Container)
+        results_container.remove_children()
+
+        # Main results
+        switch_rate = self.results.switch_rate * 100
+        stay_rate = self.results.stay_rate * 100
+        theo_switch = self.results.theoretical_switch_rate * 100
+        theo_stay = self.results.theoretical_stay_rate * 100
+
+        await results_container.mount(
+            Static("[bold green]SIMULATION COMPLETE![/]", classes="success"),
+            Rule(),
+            Static(f"[bold]Strategy Results:[/]"),
+            Static(
+                f"Switch: [green]{switch_rate:.1f}%[/] (theory: {theo_switch:.1f}%)"
+            ),
+            Static(f"Stay:   [red]{stay_rate:.1f}%[/] (theory: {theo_stay:.1f}%)"),
+            Static(f"Switch advantage: [bold]{switch_rate/stay_rate:.1f}x[/]"),
+            Rule(),
+            Collapsible(
+                self.create_detailed_stats(),
+                title="Detailed Statistics",
+                collapsed=False,
+            ),
+        )
+
+        self.query_one("#status", Static).update(
+            "[bold green]Simulation complete![/] Press ESC to return to menu."
+        )
+
+    def create_detailed_stats(self) -> Container:
+        """Create detailed statistics display"""
+        if not self.results:
+            return Container()
+
+        # Create data table for door distributions
+        table = DataTable()
+        table.add_column("Door", width=8)
+        table.add_column("Car Location", width=15)
+        table.add_column("Player Choice", width=15)
+        table.add_column("Expected %", width=12)
+
+        expected_pct = self.results.theoretical_stay_rate * 100
+        for door in range(self.num_doors):
+            car_pct = (
+                self.results.car_door_counts[door] / self.results.num_games
+            ) * 100
+            choice_pct = (
+                self.results.player_choice_counts[door] / self.results.num_games
+            ) * 100
+
+            table.add_row(
+                str(door),
+                f"{car_pct:.1f}%",
+                f"{choice_pct:.1f}%",
+                f"{expected_pct:.1f}%",
+            )
+
+        return Container(
+            Static("[bold]Door Distribution Analysis:[/]"),
+            table,
+            classes="stats-container",
+        )
+
+    def action_back(self) -> None:
+        self.app.pop_screen()
+
+
+class InteractiveGameScreen(Screen):
+    """Screen for playing the interactive Monty Hall game"""
+
+    BINDINGS = [Binding("escape", "back", "Back to Menu")]
+
+    def __init__(self, num_doors: int = 3):
+        super().__init__()
+        self.num_doors = num_doors
+
+        # Game state for current game
+        self.car_door = None
+        self.initial_choice = None
+        self.doors_opened_by_host = 0  # Bitmask, bit i set when door i is open
+        self.final_choice = None
+        self.game_phase = (
+            "initial"  # "initial", "host_opens", "final_choice", "game_over"
+        )
+        self.countdown_active = False
+        self.countdown_seconds = 0
+
+        # Overall statistics tracking
+        self.total_games = 0
+        self.total_wins = 0
+        self.total_losses = 0
+        self.switch_wins = 0
+        self.switch_losses = 0
+        self.stay_wins = 0
+        self.stay_losses = 0
+
+        # Round tracking
+        self.current_round = 1
+        self.games_in_current_round = 0
+        self.wins_in_current_round = 0
+        self.rounds_played = 0
+        self.rounds_won = 0
+
+        # Game widgets are built once and updated in place between phases,
+        # so games with many doors don't remount every door button each game.
+        # New Game / Restart Round / New Round live in the stats container
+        self._door_buttons = [
+            Button(f"Door {i}", id=f"door-{i}", classes="door-button")
+            for i in range(num_doors)
+        ]
+        self._action_buttons = {
+            "continue": Button(
+                "Continue to Final Choice", id="continue", classes="continue-button"
+            ),
+            "stay": Button("STAY", id="stay", classes="stay-button"),
+            "switch": Button("SWITCH", id="switch", classes="switch-button"),
+        }
+
+    def compose(self) -> ComposeResult:
+        yield Header(show_clock=True)
+        yield Container(
+            Static(
+                f"[bold blue]Interactive Monty Hall Game[/] - {self.num_doors} doors",
+                classes="title",
+            ),
+            Rule(),
+            Container(
+                Static(id="game-title"),
+                Static(id="game-phase"),
+                Horizontal(*self._door_buttons, id="doors", classes="doors-container"),
+                Static(id="game-doors"),
+                Rule(),
+                Static(id="game-message"),
+                Horizontal(*self._action_buttons.values(), classes="result-buttons"),
+                Rule(),
+                Static(id="game-hints"),
+                id="game-container",
+            ),
+            Container(id="stats-container"),  # Only one container for all stats
+            classes="game-screen",
+        )
+        yield Footer()
+
+    async def on_mount(self) -> None:
+        await self.start_new_game()
+        self.update_stats_display()
+        self.update_round_display()
+
+    async def start_new_game(self):
+        """Start a new game"""
+        print(f"DEBUG: Starting new game in round {self.current_round}")
+        self.car_door = random.randint(0, self.num_doors - 1)
+        self.initial_choice = None
+        self.doors_opened_by_host = 0
+        self.final_choice = None
+        self.game_phase = "initial"
+        self.games_in_current_round += 1
+        print(f"DEBUG: Car is behind door {self.car_door}")
+        print(
+            f"DEBUG: Game #{self.games_in_current_round} in round {self.current_round}"
+        )
+        await self.show_game_interface()
+
+    async def start_new_round(self):
+        """Start a new round - check if current round was won, then reset round stats"""
+        print(f"DEBUG: Starting new round (was round {self.current_round})")
+        # Check if current round was won (player won more than half the games)
+        if self.games_in_current_round > 0:
+            self.rounds_played += 1
+            if self.wins_in_current_round > self.games_in_current_round / 2:
+                self.rounds_won += 1
+                print(
+                    f"DEBUG: Round {self.current_round} was WON ({self.wins_in_current_round}/{self.games_in_current_round})"
+                )
+            else:
+                print(
+                    f"DEBUG: Round {self.current_round} was LOST ({self.wins_in_current_round}/{self.games_in_current_round})"
+                )
+
+        # Start new round
+        self.current_round += 1
+        self.games_in_current_round = 0
+        self.wins_in_current_round = 0
+        print(f"DEBUG: Now starting round {self.current_round}")
+        self.update_round_display()
+        await self.start_new_game()
+
+    async def restart_current_round(self):
+        """Restart the current round - reset round stats but keep round number"""
+        print(f"DEBUG: Restarting current round {self.current_round}")
+        self.games_in_current_round = 0
+        self.wins_in_current_round = 0
+        self.update_round_display()
+        await self.start_new_game()
+
+    def update_stats_display(self):
+        """Update the statistics display with all information combined"""
+        stats_container = self.query_one("#stats-container", Container)
+        stats_container.remove_children()
+
+        # Calculate statistics
+        win_rate = (
+            (self.total_wins / self.total_games * 100) if self.total_games > 0 else 0
+        )
+        switch_win_rate = (
+            (self.switch_wins / (self.switch_wins + self.switch_losses) * 100)
+            if (self.switch_wins + self.switch_losses) > 0
+            else 0
+        )
+        stay_win_rate = (
+            (self.stay_wins / (self.stay_wins + self.stay_losses) * 100)
+            if (self.stay_wins + self.stay_losses) > 0
+            else 0
+        )
+
+        # Get round statistics
+        round_win_rate = (
+            (self.wins_in_current_round / self.games_in_current_round * 100)
+            if self.games_in_current_round > 0
+            else 0
+        )
+        overall_round_win_rate = (
+            (self.rounds_won / self.rounds_played * 100)
+            if self.rounds_played > 0
+            else 0
+        )
+
+        # Create buttons container
+        buttons_container = Horizontal(
+            Button("New Game", id="new-game", classes="round-button"),
+            Button("Restart Round", id="restart-round", classes="round-button"),
+            Button("New Round", id="new-round", classes="round-button"),
+            classes="round-buttons",
+        )
+
+        # Mount all elements in one container
+        stats_container.mount(
+            Rule(),
+            Static("[bold]Game Statistics:[/]", classes="stats-title"),
+            Static(f"Total games: {self.total_games}"),
+            Static(f"Total wins: {self.total_wins} ({win_rate:.1f}%)"),
+            Static(
+                f"Switch strategy: {self.switch_wins}W-{self.switch_losses}L ({switch_win_rate:.1f}%)"
+            ),
+            Static(
+                f"Stay strategy: {self.stay_wins}W-{self.stay_losses}L ({stay_win_rate:.1f}%)"
+            ),
+            Rule(),
+            Static("[bold]Current Round:[/]", classes="round-title"),
+            Static(f"Round #{self.current_round}"),
+            Static(f"Games in round: {self.games_in_current_round}"),
+            Static(
+                f"Wins in round: {self.wins_in_current_round} ({round_win_rate:.1f}%)"
+            ),
+            Rule(),
+            Static("[bold]Round History:[/]", classes="round-title"),
+            Static(f"Rounds played: {self.rounds_played}"),
+            Static(f"Rounds won: {self.rounds_won} ({overall_round_win_rate:.1f}%)"),
+            buttons_container,
+            Rule(),
+        )
+        self.refresh()
+
+    def update_round_display(self):
+        """Update the round information display - now combined with stats"""
+        self.update_stats_display()
+
+    async def show_game_interface(self):
+        """Show the main game interface based on current phase"""
+        self.query_one("#game-title", Static).update(
+            f"[bold]Round #{self.current_round} - Game #{self.games_in_current_round}[/]"
+        )
+
+        # The door buttons are only needed in phase 1, later phases list the
+        # door states as text instead of relabelling every button
+        choosing = self.game_phase == "initial"
+        self.query_one("#doors", Horizontal).display = choosing
+        self.query_one("#game-doors", Static).display = not choosing
+
+        if self.game_phase == "initial":
+            self.show_initial_choice()
+        elif self.game_phase == "host_opens":
+            self.show_host_opens()
+        elif self.game_phase == "final_choice":
+            self.show_final_choice()
+        elif self.game_phase == "game_over":
+            self.show_game_result()
+
+    def set_game_text(
+        self, phase: str, doors: str, message: str, hints: str = ""
+    ) -> None:
+        """Update the game text widgets in place"""
+        self.query_one("#game-phase", Static).update(phase)
+        self.query_one("#game-doors", Static).update(doors)
+        self.query_one("#game-message", Static).update(message)
+        game_hints = self.query_one("#game-hints", Static)
+        game_hints.update(hints)
+        game_hints.display = bool(hints)
+
+    def show_action_buttons(self, *button_ids: str) -> None:
+        """Show only the given action buttons"""
+        for button_id, button in self._action_buttons.items():
+            button.display = button_id in button_ids
+
+    def show_initial_choice(self):
+        """Show initial door selection phase"""
+        prob_correct = (1 / self.num_doors) * 100
+        prob_others = ((self.num_doors - 1) / self.num_doors) * 100
+
+        self.query_one("#game-phase", Static).remove_class("result-message")
+        self.set_game_text(
+            "[bold]Phase 1: Choose your initial door[/]",
+            "",
+            "🚗 One door has a car, the others have goats! 🐐",
+            f"💡 [dim]Your choice has {prob_correct:.1f}% chance of being correct[/]\n"
+            f"💡 [dim]The other {self.num_doors-1} doors combined have {prob_others:.1f}% chance[/]",
+        )
+        self.show_action_buttons()
+
+    def show_host_opens(self):
+        """Show host opening doors phase"""
+        # Host opens N-2 doors (all doors except player's choice and one other)
+        doors_to_keep_closed = 1 << self.car_door
+        if self.initial_choice != self.car_door:
+            # If player didn't choose car, keep their door closed too
+            doors_to_keep_closed |= 1 << self.initial_choice
+        else:
+            # If player chose car, keep one random other door closed
+            other_door = random.randint(0, self.num_doors - 2)
+            doors_to_keep_closed |= 1 << (other_door + (other_door >= self.car_door))
+
+        # Open all other doors
+        all_doors = (1 << self.num_doors) - 1
+        self.doors_opened_by_host = all_doors & ~doors_to_keep_closed
+
+        # Show door states
+        door_displays = []
+        for i in range(self.num_doors):
+            if i == self.initial_choice:
+                door_displays.append(f"[bold green]Door {i}: YOUR CHOICE[/]")
+            elif (self.doors_opened_by_host >> i) & 1:
+                door_displays.append(f"[red]Door {i}: 🐐 GOAT (opened by host)[/]")
+            else:
+                door_displays.append(f"[yellow]Door {i}: ? UNKNOWN[/]")
+
+        other_door = self.get_switch_door()
+
+        self.set_game_text(
+            "[bold]Phase 2: Host opens doors with goats[/]",
+            "\n".join(door_displays),
+            f"[bold]The host opened {self.num_doors - 2} doors with goats![/]\n"
+            f"[bold]Only 2 doors remain: your choice (Door {self.initial_choice}) and Door {other_door}[/]",
+        )
+        self.show_action_buttons("continue")
+
+    def get_switch_door(self) -> int:
+        """The one door besides the initial choice that the host left closed"""
+        all_doors = (1 << self.num_doors) - 1
+        closed = all_doors & ~self.doors_opened_by_host & ~(1 << self.initial_choice)
+        return closed.bit_length() - 1
+
+    def show_final_choice(self):
+        """Show final choice phase (stay or switch)"""
+        other_door = self.get_switch_door()
+
+        # Show door states
+        door_displays = []
+        for i in range(self.num_doors):
+            if i == self.initial_choice:
+                door_displays.append(f"[bold green]Door {i}: YOUR ORIGINAL CHOICE[/]")
+            elif (self.doors_opened_by_host >> i) & 1:
+                door_displays.append(f"[dim red]Door {i}: 🐐 GOAT (opened)[/]")
+            elif i == other_door:
+                door_displays.append(f"[bold yellow]Door {i}: SWITCH OPTION[/]")
+
+        prob_stay = (1 / self.num_doors) * 100
+        prob_switch = ((self.num_doors - 1) / self.num_doors) * 100
+
+        self._action_buttons["stay"].label = f"STAY with Door {self.initial_choice}"
+        self._action_buttons["switch"].label = f"SWITCH to Door {other_door}"
+        self.set_game_text(
+            "[bold]Phase 3: Final Decision - Stay or Switch?[/]",
+            "\n".join(door_displays),
+            "[bold]Now you must make your final choice:[/]",
+            f"💡 [dim]Probability of winning if you STAY: {prob_stay:.1f}%[/]\n"
+            f"💡 [dim]Probability of winning if you SWITCH: {prob_switch:.1f}%[/]",
+        )
+        self.show_action_buttons("stay", "switch")
+
+    def show_game_result(self):
+        """Show the final game result"""
+        if self.countdown_active:
+            if self.final_choice == self.car_door:
+                status_msg = f"[bold green]🎉 YOU WON! 🎉 Next game starting in {self.countdown_seconds} seconds...[/]"
+            else:
+                status_msg = f"[bold red]😞 You lost. Next game starting in {self.countdown_seconds} seconds...[/]"
+        else:
+            won = self.final_choice == self.car_door
+            if won:
+                status_msg = "[bold green]🎉 CONGRATULATIONS! YOU WON THE CAR! 🎉[/]"
+            else:
+                status_msg = (
+                    "[bold red]😞 Sorry, you got a goat. Better luck next time![/]"
+                )
+
+        # Show all door contents
+        door_reveals = []
+        for i in range(self.num_doors):
+            if i == self.car_door:
+                door_reveals.append(f"[bold green]Door {i}: 🚗 CAR[/]")
+            else:
+                door_reveals.append(f"[red]Door {i}: 🐐 GOAT[/]")
+
+        strategy = "SWITCHED" if self.final_choice != self.initial_choice else "STAYED"
+
+        self.query_one("#game-phase", Static).add_class("result-message")
+        self.set_game_text(
+            status_msg,
+            "[bold]Final Results:[/]\n" + "\n".join(door_reveals),
+            "[bold]Your journey:[/]\n"
+            f"• Initial choice: Door {self.initial_choice}\n"
+            f"• Final choice: Door {self.final_choice}\n"
+            f"• Strategy: {strategy}\n"
+            f"• Car was behind: Door {self.car_door}",
+        )
+
+        self.show_action_buttons()  # No stay/switch once the game is over
+
+    def on_button_pressed(self, event: Button.Pressed) -> None:
+        """Handle button presses"""
+        button_id = event.button.id or ""
+        print(f"DEBUG: Button pressed: {button_id}")
+        print(f"DEBUG: game_phase = {self.game_phase}")
+        print(f"DEBUG: countdown_active = {self.countdown_active}")
+
+        if self.countdown_active:
+            print("DEBUG: Ignoring button press - countdown active")
+            return
+
+        if button_id.startswith("door-") and self.game_phase == "initial":
+            door_num = int(button_id.split("-")[1])
+            print(f"DEBUG: Initial choice - Door {door_num}")
+            self.initial_choice = door_num
+            self.game_phase = "host_opens"
+            self.call_later(self.show_game_interface)
+
+        elif button_id == "continue" and self.game_phase == "host_opens":
+            print("DEBUG: Moving to final choice phase")
+            self.game_phase = "final_choice"
+            self.call_later(self.show_game_interface)
+
+        elif button_id == "stay" and self.game_phase == "final_choice":
+            print("DEBUG: Player chose to STAY")
+            self.final_choice = self.initial_choice
+            self.record_game_result("stay")
+
+        elif button_id == "switch" and self.game_phase == "final_choice":
+            print("DEBUG: Player chose to SWITCH")
+            self.final_choice = self.get_switch_door()
+            self.record_game_result("switch")
+
+        elif button_id == "new-game":
+            print("DEBUG: New game button pressed")
+            self.call_later(self.start_new_game)
+        elif button_id == "restart-round":
+            print("DEBUG: Restart round button pressed")
+            self.call_later(self.restart_current_round)
+        elif button_id == "new-round":
+            print("DEBUG: New round button pressed")
+            self.call_later(self.start_new_round)
+        else:
+            print(f"DEBUG: Unhandled button: {button_id}")
+
+    def record_game_result(self, strategy):
+        """Record the result of the completed game"""
+        print(f"DEBUG: Recording game result - strategy: {strategy}")
+
+        self.total_games += 1
+        won = self.final_choice == self.car_door
+
+        if won:
+            self.total_wins += 1
+            self.wins_in_current_round += 1
+            if strategy == "switch":
+                self.switch_wins += 1
+            else:
+                self.stay_wins += 1
+        else:
+            self.total_losses += 1
+            if strategy == "switch":
+                self.switch_losses += 1
+            else:
+                self.stay_losses += 1
+
+        self.game_phase = "game_over"
+
+        # Update displays
+        self.update_stats_display()
+        self.update_round_display()
+
+        # Always start countdown (for both wins and losses)
+        self.run_worker(self.start_game_countdown(won), exclusive=True)
+
+    async def start_game_countdown(self, won):
+        """Start 5-second countdown after game ends, then start new game"""
+        print(f"DEBUG: Starting game countdown - won: {won}")
+        self.countdown_active = True
+        self.countdown_seconds = 5
+
+        # Update displays to show the result
+        await self.show_game_interface()
+
+        # Countdown loop
+        for i in range(5, 0, -1):
+            print(f"DEBUG: Countdown: {i}")
+            self.countdown_seconds = i
+            await self.show_game_interface()
+            await asyncio.sleep(1)
+
+        # Reset countdown and start new game
+        print("DEBUG: Countdown finished, starting new game")
+        self.countdown_active = False
+        self.countdown_seconds = 0
+        await self.start_new_game()
+
+    def action_back(self) -> None:
+        self.app.pop_screen()
+
+
+class SettingsModal(ModalScreen[tuple[int, int]]):
+    """Modal for simulation settings"""
+
+    def compose(self) -> ComposeResult:
+        yield Container(
+            Static("[bold]Simulation Settings[/]", classes="modal-title"),
+            Rule(),
+            Label("Number of doors (minimum 3):"),
+            Input(value="3", id="doors-input"),
+            Label("Number of games:"),
+            Input(value="10000", id="games-input"),
+            Rule(),
+            Horizontal(
+                Button("Start Simulation", variant="primary", id="start"),
+                Button("Cancel", id="cancel"),
+                classes="button-row",
+            ),
+            classes="settings-modal",
+        )
+
+    def on_button_pressed(self, event: Button.Pressed) -> None:
+        if event.button.id == "start":
+            doors_input = self.query_one("#doors-input", Input)
+            games_input = self.query_one("#games-input", Input)
+
+            try:
+                doors = max(3, int(doors_input.value))
+                games = max(1, int(games_input.value))
+                self.dismiss((games, doors))
+            except ValueError:
+                # Invalid input, keep modal open
+                doors_input.focus()
+        elif event.button.id == "cancel":
+            self.dismiss(None)
+
+
+class GameSettingsModal(ModalScreen[int]):
+    """Modal for interactive game settings"""
+
+    def compose(self) -> ComposeResult:
+        yield Container(
+            Static("[bold]Game Settings[/]", classes="modal-title"),
+            Rule(),
+            Label("Number of doors (minimum 3):"),
+            Input(value="3", id="doors-input"),
+            Rule(),
+            Horizontal(
+                Button("Start Game", variant="primary", id="start"),
+                Button("Cancel", id="cancel"),
+                classes="button-row",
+            ),
+            classes="settings-modal",
+        )
+
+    def on_button_pressed(self, event: Button.Pressed) -> None:
+        if event.button.id == "start":
+            doors_input = self.query_one("#doors-input", Input)
+
+            try:
+                doors = max(3, int(doors_input.value))
+                self.dismiss(doors)
+            except ValueError:
+                doors_input.focus()
+        elif event.button.id == "cancel":
+            self.dismiss(None)
+
+
+class MontyHallApp(App):
+    """Main Monty Hall TUI Application"""
+
+    CSS = """
+    .title {
+        text-align: center;
+        padding: 1;
+    }
+    
+    .menu-container {
+        align: center middle;
+        max-width: 60;
+    }
+    
+    .menu-button {
+        width: 100%;
+        margin: 1;
+    }
+    
+    .doors-container {
+        align: center middle;
+        padding: 2;
+    }
+    
+    .door-button {
+        margin: 0 1;
+        min-width: 12;
+    }
+    
+    .choice-buttons {
+        align: center middle;
+        padding: 1;
+    }
+    
+    .choice-button {
+        margin: 0 1;
+        min-width: 30;  /* Increased minimum width */
+        text-align: center;  /* Center the text */
+    }
+    
+    .stay-button {
+        background: red 30%;
+        color: white;  /* Added white text color */
+    }
+    
+    .switch-button {
+        background: green 30%;
+        color: white;  /* Added white text color */
+    }
+    
+    .result-message {
+        text-align: center;
+        padding: 1;
+    }
+    
+    .settings-modal {
+        align: center middle;
+        background: $panel;
+        border: thick $primary;
+        width: 50;
+        height: auto;
+        padding: 1;
+    }
+    
+    .modal-title {
+        text-align: center;
+        padding-bottom: 1;
+    }
+    
+    .button-row {
+        align: center middle;
+        padding-top: 1;
+    }
+    
+    .success {
+        color: green;
+        text-align: center;
+    }
+    
+    .stats-container {
+        padding: 1;
+    }
+    
+    .stats-title {
+        text-align: center;
+        padding: 1;
+    }
+    
+    .round-title {
+        text-align: center;
+        padding: 1;
+    }
+    
+    .round-buttons {
+        align: center middle;
+        padding: 1;
+    }
+    
+    .round-button {
+        margin: 0 1;
+        background: $primary 30%;
+        color: white;  /* Added white text color */
+    }
+    
+    .result-buttons {
+        align: center middle;
+        padding: 1;
+    }
+    """
+
+    BINDINGS = [Binding("q", "quit", "Quit"), Binding("ctrl+c", "quit", "Quit")]
+
+    def compose(self) -> ComposeResult:
+        yield Header(show_clock=True)
+        yield Container(
+            Static("[bold blue]🎰 MONTY HALL PROBLEM SIMULATOR 🎰[/]", classes="title"),
+            Static("[dim]The famous probability puzzle![/]", classes="title"),
+            Rule(),
+            Container(
+                Button(
+                    "📊 Statistical Simulation", id="simulation", classes="menu-button"
+                ),
+                Button("🎮 Interactive Game", id="game", classes="menu-button"),
+                Button("❓ About", id="about", classes="menu-button"),
+                Button("🚪 Quit", id="quit", classes="menu-button"),
+                classes="menu-container",
+            ),
+            classes="main-menu",
+        )
+        yield Footer()
+
+    def on_button_pressed(self, event: Button.Pressed) -> None:
+        button_id = event.button.id
+
+        if button_id == "simulation":
+
+            def check_simulation_result(result):
+                if result:
+                    games, doors = result
+                    self.push_screen(SimulationScreen(games, doors))
+
+            self.push_screen(SettingsModal(), check_simulation_result)
+
+        elif button_id == "game":
+
+            def check_game_result(doors):
+                if doors:
+                    self.push_screen(InteractiveGameScreen(doors))
+
+            self.push_screen(GameSettingsModal(), check_game_result)
+
+        elif button_id == "about":
+            self.show_about()
+
+        elif button_id == "quit":
+            self.exit()
+
+    def show_about(self):
+        """Show about information"""
+        about_text = """[bold blue]The Monty Hall Problem[/bold blue]
+
+Named after game show host Monty Hall, this famous probability puzzle demonstrates counter-intuitive statistics.
+
+[bold]The Setup:[/bold]
+• You choose one of three doors (one has a car, others have goats)
+• Monty opens a door with a goat (not your choice, not the car)
+• You can switch to the remaining door or stay with your choice
+
+[bold]The Surprise:[/bold]
+• Staying gives you a 1/3 (33.3%) chance of winning
+• Switching gives you a 2/3 (66.7%) chance of winning!
+
+[bold]Why?[/bold]
+Your initial choice had a 1/3 chance of being correct. When Monty eliminates a wrong door, the remaining door gets the combined probability of all the doors you didn't pick: 2/3!
+
+With more doors, this effect becomes even more dramatic. With 100 doors, staying gives you 1% chance, while switching gives you 99% chance!
+
+This simulator lets you run statistical simulations and play interactively to experience the puzzle firsthand.
+
+Press ESC to return to the menu."""
+
+        # Create a simple screen for about info
+        class AboutScreen(Screen):
+            BINDINGS = [Binding("escape", "back", "Back")]
+
+            def compose(self):
+                yield Header()
+                yield Container(
+                    Static(about_text, classes="about-text"), classes="about-container"
+                )
+                yield Footer()
+
+            def action_back(self):
+                self.app.pop_screen()
+
+        self.push_screen(AboutScreen())
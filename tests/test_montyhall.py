@@ -0,0 +1,38 @@
+import numpy as np
+import pytest
+
+import montyhall
+
+
+@pytest.mark.parametrize(
+    "batch, num_doors",
+    [
+        (10_000, 3),  # Joint histogram branch
+        (50, 10),  # num_doors ** 2 > batch, separate bincounts
+    ],
+)
+def test_run_batch_counts_add_up(batch, num_doors):
+    rng = np.random.default_rng(0)
+    scratch = np.empty(batch, dtype=np.intp)
+    stay, switch, car_counts, choice_counts = montyhall.run_batch(
+        rng, batch, num_doors, scratch
+    )
+
+    assert stay + switch == batch
+    assert car_counts.shape == choice_counts.shape == (num_doors,)
+    assert car_counts.sum() == batch
+    assert choice_counts.sum() == batch
+
+
+def test_native_library_returns_door_counts():
+    simulate = montyhall._load_mh_library()
+    if simulate is None:
+        pytest.skip("_mh.so is not built")
+
+    switch, stay, car_counts, choice_counts = simulate(10_000, 5)
+
+    assert stay + switch == 10_000
+    for counts in (car_counts, choice_counts):
+        assert counts.shape == (5,)
+        assert counts.dtype == np.uint64
+        assert counts.sum() == 10_000